@@ -5,13 +5,164 @@ The coatings module contains classes for modeling optical coatings.
 Kramer Harrison, 2024
 """
 
+import cmath
+import math
 from abc import ABC, abstractmethod
 
+import numpy as np
+from numba import njit, prange
+
 import optiland.backend as be
 from optiland.jones import JonesFresnel
-from optiland.materials import BaseMaterial
+from optiland.materials import BaseMaterial, IdealMaterial
 from optiland.rays import RealRays
 
+# real and complex output dtypes of the NumPy coating kernels
+_DTYPES = {
+    "float32": (np.float32, np.complex64),
+    "float64": (np.float64, np.complex128),
+}
+_precision = "float64"
+
+
+def set_kernel_precision(precision: str) -> None:
+    """Set the output precision of the NumPy coating kernels.
+
+    The kernels always read the float64 ray and normal arrays as they are,
+    and only their output is stored in the given precision. Single precision
+    halves the size of the angle of incidence and Jones matrix outputs, at
+    roughly 7 significant digits. The polarization state of `PolarizedRays`
+    is still updated in float64. This is separate from
+    `optiland.backend.set_precision`, which sets the precision of the torch
+    backend.
+
+    Args:
+        precision (str): Either 'float32' or 'float64'.
+
+    Raises:
+        ValueError: If the precision is not 'float32' or 'float64'.
+
+    """
+    global _precision
+    if precision not in _DTYPES:
+        raise ValueError("Precision must be 'float32' or 'float64'.")
+    _precision = precision
+
+
+def get_kernel_precision() -> str:
+    """Get the output precision of the NumPy coating kernels."""
+    return _precision
+
+
+@njit(fastmath=True, cache=True)
+def fast_arccos(x):  # pragma: no cover
+    """Polynomial approximation of arccos for 0 <= x <= 1.
+
+    Uses Abramowitz & Stegun 4.4.46, which has an absolute error of about 2e-8.
+
+    Args:
+        x (float): The input value, between 0 and 1.
+
+    Returns:
+        float: The arccos of x, in radians.
+
+    """
+    p = -0.0012624911
+    p = p * x + 0.0066700901
+    p = p * x - 0.0170881256
+    p = p * x + 0.0308918810
+    p = p * x - 0.0501743046
+    p = p * x + 0.0889789874
+    p = p * x - 0.2145988016
+    p = p * x + 1.5707963050
+    return math.sqrt(1.0 - x) * p
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def compute_aoi(nx, ny, nz, L, M, N, out):  # pragma: no cover
+    """Compute the angle of incidence in a single fused pass.
+
+    Args:
+        nx (numpy.ndarray): x-component of the surface normal vectors.
+        ny (numpy.ndarray): y-component of the surface normal vectors.
+        nz (numpy.ndarray): z-component of the surface normal vectors.
+        L (numpy.ndarray): x-component of the incident ray direction cosines.
+        M (numpy.ndarray): y-component of the incident ray direction cosines.
+        N (numpy.ndarray): z-component of the incident ray direction cosines.
+        out (numpy.ndarray): Output array for the angle of incidence.
+
+    Returns:
+        numpy.ndarray: The angle of incidence for each ray.
+
+    """
+    for i in prange(out.size):
+        dot = abs(nx[i] * L[i] + ny[i] * M[i] + nz[i] * N[i])
+        if dot > 1.0:  # required due to numerical precision
+            dot = 1.0
+        out[i] = fast_arccos(dot)
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def fresnel_jones(nx, ny, nz, L, M, N, n, reflect, out):  # pragma: no cover
+    """Compute Fresnel Jones matrices directly from the ray geometry.
+
+    The cosine of the angle of incidence is taken from the dot product of the
+    surface normal and the incident direction, so the angle itself is never
+    formed. The Fresnel coefficients are written to the diagonal of `out`,
+    which must be zero-initialized.
+
+    Args:
+        nx (numpy.ndarray): x-component of the surface normal vectors.
+        ny (numpy.ndarray): y-component of the surface normal vectors.
+        nz (numpy.ndarray): z-component of the surface normal vectors.
+        L (numpy.ndarray): x-component of the incident ray direction cosines.
+        M (numpy.ndarray): y-component of the incident ray direction cosines.
+        N (numpy.ndarray): z-component of the incident ray direction cosines.
+        n (numpy.ndarray): Ratio of the post- to pre-surface refractive index.
+        reflect (bool): Whether to compute the reflection (True) or
+            transmission (False) coefficients.
+        out (numpy.ndarray): Complex output array of shape (N, 3, 3).
+
+    Returns:
+        numpy.ndarray: The Jones matrix for each ray.
+
+    """
+    for i in prange(out.shape[0]):
+        cos_i = abs(nx[i] * L[i] + ny[i] * M[i] + nz[i] * N[i])
+        if cos_i > 1.0:  # required due to numerical precision
+            cos_i = 1.0
+        n2 = n[i] * n[i]
+        root = cmath.sqrt(complex(n2 - (1.0 - cos_i * cos_i), 0.0))
+        if reflect:
+            out[i, 0, 0] = (cos_i - root) / (cos_i + root)
+            out[i, 1, 1] = -(n2 * cos_i - root) / (n2 * cos_i + root)
+            out[i, 2, 2] = -1.0
+        else:
+            out[i, 0, 0] = 2.0 * cos_i / (cos_i + root)
+            out[i, 1, 1] = 2.0 * n[i] * cos_i / (n2 * cos_i + root)
+            out[i, 2, 2] = 1.0
+    return out
+
+
+def _broadcast_inputs(*arrays):
+    """Broadcasts kernel inputs to a common shape.
+
+    Float64 arrays are passed through without a copy. Other inputs, such as
+    scalar normals, are converted to float64.
+
+    Args:
+        *arrays (float or numpy.ndarray): The kernel inputs.
+
+    Returns:
+        list[numpy.ndarray]: Read-only views of the inputs, broadcast to a
+            common shape.
+
+    """
+    arrays = [np.asarray(a, dtype=np.float64) for a in arrays]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    return [np.broadcast_to(a, shape) for a in arrays]
+
 
 class BaseCoating(ABC):
     """Base class for coatings.
@@ -23,8 +174,15 @@ class BaseCoating(ABC):
         reflect: Abstract method to handle reflection interaction with the coating.
         transmit: Abstract method to handle transmission interaction with the coating.
 
+    Note:
+        Coatings declare ``__slots__`` to keep instances small and attribute
+        access fast, so attributes not declared by a class cannot be set on
+        its instances.
+
     """
 
+    __slots__ = ()
+
     _registry = {}
 
     def __init_subclass__(cls, **kwargs):
@@ -74,8 +232,19 @@ class BaseCoating(ABC):
             be.ndarray: The angle of incidence for each ray.
 
         """
-        dot = be.abs(nx * rays.L0 + ny * rays.M0 + nz * rays.N0)
-        dot = be.clip(dot, -1, 1)  # required due to numerical precision
+        if be.get_backend() == "numpy":
+            arrays = _broadcast_inputs(nx, ny, nz, *rays.dir_soa)
+            out = np.empty(arrays[0].shape, dtype=_DTYPES[_precision][0])
+            return compute_aoi(*arrays, out)
+
+        if all(be.is_array_like(n) and be.size(n) > 1 for n in (nx, ny, nz)):
+            normals = be.stack([nx, ny, nz])
+            dot = be.abs(be.einsum("ij,ij->j", normals, rays.dir_soa))
+        else:  # scalar normals, e.g. on paraxial surfaces
+            dot = be.abs(nx * rays.L0 + ny * rays.M0 + nz * rays.N0)
+        # required due to numerical precision; dot is non-negative, so only the
+        # upper bound is clamped, in place (torch tensor method)
+        dot.clamp_(max=1.0)
         return be.arccos(dot)
 
     @abstractmethod
@@ -173,6 +342,8 @@ class SimpleCoating(BaseCoating):
 
     """
 
+    __slots__ = ("transmittance", "reflectance", "absorptance")
+
     def __init__(self, transmittance, reflectance=0):
         self.transmittance = transmittance
         self.reflectance = reflectance
@@ -197,7 +368,7 @@ class SimpleCoating(BaseCoating):
             RealRays: The rays after reflection.
 
         """
-        rays.i = rays.i * self.reflectance
+        rays.i = self.scale_intensity(rays.i, self.reflectance)
         return rays
 
     def transmit(
@@ -220,9 +391,32 @@ class SimpleCoating(BaseCoating):
             RealRays: The rays after transmission.
 
         """
-        rays.i = rays.i * self.transmittance
+        rays.i = self.scale_intensity(rays.i, self.transmittance)
         return rays
 
+    @staticmethod
+    def scale_intensity(intensity: be.ndarray, factor):
+        """Scales ray intensities by a factor.
+
+        The intensities are scaled out of place, as the ray intensity array
+        may share memory with the array passed to `RealRays`. Scalar factors
+        of 1 and 0 skip the multiplication entirely.
+
+        Args:
+            intensity (be.ndarray): The ray intensities.
+            factor (float or be.ndarray): The scaling factor(s).
+
+        Returns:
+            be.ndarray: The scaled intensities.
+
+        """
+        if isinstance(factor, (int, float)):
+            if factor == 1:
+                return intensity
+            if factor == 0:
+                return be.zeros_like(intensity)
+        return intensity * factor
+
     def to_dict(self):
         """Converts the coating to a dictionary.
 
@@ -262,6 +456,8 @@ class BaseCoatingPolarized(BaseCoating, ABC):
 
     """
 
+    __slots__ = ()
+
     def reflect(
         self,
         rays: RealRays,
@@ -351,14 +547,131 @@ class FresnelCoating(BaseCoatingPolarized):
         jones (JonesFresnel): The JonesFresnel object, which calculates the
             Jones matrices for given ray properties.
 
+    Note:
+        With the NumPy backend, the angle of incidence and the Fresnel
+        coefficients are computed together in a single compiled kernel. For
+        other backends, the coefficients are evaluated with
+        `JonesFresnel.fresnel_matrix`, using a scalar index ratio when both
+        materials are currently `IdealMaterial` instances.
+
     """
 
+    __slots__ = ("material_pre", "material_post", "jones")
+
     def __init__(self, material_pre, material_post):
         self.material_pre = material_pre
         self.material_post = material_post
 
         self.jones = JonesFresnel(material_pre, material_post)
 
+    def reflect(
+        self,
+        rays: RealRays,
+        nx: be.ndarray = None,
+        ny: be.ndarray = None,
+        nz: be.ndarray = None,
+    ):
+        """Reflects the rays off the coating.
+
+        Args:
+            rays (RealRays): The rays to be reflected.
+            nx (be.ndarray, optional): The x-component of the surface normal vector.
+            ny (be.ndarray, optional): The y-component of the surface normal vector.
+            nz (be.ndarray, optional): The z-component of the surface normal vector.
+
+        Returns:
+            RealRays: The updated rays after reflection.
+
+        """
+        rays.update(self._calculate_jones(rays, nx, ny, nz, reflect=True))
+        return rays
+
+    def transmit(
+        self,
+        rays: RealRays,
+        nx: be.ndarray = None,
+        ny: be.ndarray = None,
+        nz: be.ndarray = None,
+    ):
+        """Transmits the rays through the coating.
+
+        Args:
+            rays (RealRays): The rays to be transmitted.
+            nx (be.ndarray, optional): The x-component of the surface normal vector.
+            ny (be.ndarray, optional): The y-component of the surface normal vector.
+            nz (be.ndarray, optional): The z-component of the surface normal vector.
+
+        Returns:
+            RealRays: The updated rays after transmission through a surface.
+
+        """
+        rays.update(self._calculate_jones(rays, nx, ny, nz, reflect=False))
+        return rays
+
+    def _calculate_jones(self, rays, nx, ny, nz, reflect):
+        """Computes the Jones matrices for the given rays and surface normals.
+
+        Args:
+            rays (RealRays): The incident rays.
+            nx (be.ndarray): The x-component of the surface normal vectors.
+            ny (be.ndarray): The y-component of the surface normal vectors.
+            nz (be.ndarray): The z-component of the surface normal vectors.
+            reflect (bool): Whether to compute the reflection (True) or
+                transmission (False) matrices.
+
+        Returns:
+            be.ndarray: The Jones matrices, with shape (N, 3, 3).
+
+        """
+        if be.get_backend() == "numpy":
+            return self._jones_fused(rays, nx, ny, nz, reflect)
+
+        aoi = self._compute_aoi(rays, nx, ny, nz)
+        n = self._constant_index_ratio()
+        if n is None:
+            n = JonesFresnel.index_ratio(self.material_pre, self.material_post, rays.w)
+        return JonesFresnel.fresnel_matrix(n, aoi, reflect, be.size(aoi))
+
+    def _jones_fused(self, rays, nx, ny, nz, reflect):
+        """Computes the Jones matrices with the fused NumPy kernel.
+
+        The index ratio is evaluated once in total when both materials have a
+        constant index or all rays share one wavelength.
+
+        Args:
+            rays (RealRays): The incident rays.
+            nx (be.ndarray): The x-component of the surface normal vectors.
+            ny (be.ndarray): The y-component of the surface normal vectors.
+            nz (be.ndarray): The z-component of the surface normal vectors.
+            reflect (bool): Whether to compute the reflection (True) or
+                transmission (False) matrices.
+
+        Returns:
+            numpy.ndarray: The Jones matrices, with shape (N, 3, 3).
+
+        """
+        n = self._constant_index_ratio()
+        if n is None:
+            n = JonesFresnel.index_ratio(self.material_pre, self.material_post, rays.w)
+
+        arrays = _broadcast_inputs(nx, ny, nz, *rays.dir_soa, n)
+        out = np.zeros((arrays[0].size, 3, 3), dtype=_DTYPES[_precision][1])
+        return fresnel_jones(*arrays, reflect, out)
+
+    def _constant_index_ratio(self):
+        """Returns the index ratio if both materials have a constant index.
+
+        Returns:
+            float or None: The ratio of the post- to pre-surface refractive
+                index, or None if either material is not an `IdealMaterial`.
+
+        """
+        if isinstance(self.material_pre, IdealMaterial) and isinstance(
+            self.material_post, IdealMaterial
+        ):
+            return self.material_post.index[0] / self.material_pre.index[0]
+        return None
+
     def to_dict(self):
         """Converts the coating to a dictionary.
 
@@ -265,6 +265,25 @@ class GaussianQuadrature(BaseDistribution):
 
     """
 
+    # radii and weights per number of rings, as plain floats so that only the
+    # requested entry is converted to a backend array
+    _RADII = {
+        1: (0.70711,),
+        2: (0.45970, 0.88807),
+        3: (0.33571, 0.70711, 0.94196),
+        4: (0.26350, 0.57446, 0.81853, 0.96466),
+        5: (0.21659, 0.48038, 0.70711, 0.87706, 0.97626),
+        6: (0.18375, 0.41158, 0.61700, 0.78696, 0.91138, 0.98300),
+    }
+    _WEIGHTS = {
+        1: (0.5,),
+        2: (0.25, 0.25),
+        3: (0.13889, 0.22222, 0.13889),
+        4: (0.08696, 0.16304, 0.16304, 0.08696),
+        5: (0.059231, 0.11966, 0.14222, 0.11966, 0.059231),
+        6: (0.04283, 0.09019, 0.11698, 0.11698, 0.09019, 0.04283),
+    }
+
     def __init__(self, is_symmetric=False):
         self.is_symmetric = is_symmetric
 
@@ -298,17 +317,9 @@ class GaussianQuadrature(BaseDistribution):
             ValueError: If the number of rings is not between 1 and 6.
 
         """
-        radius_dict = {
-            1: be.array([0.70711]),
-            2: be.array([0.45970, 0.88807]),
-            3: be.array([0.33571, 0.70711, 0.94196]),
-            4: be.array([0.26350, 0.57446, 0.81853, 0.96466]),
-            5: be.array([0.21659, 0.48038, 0.70711, 0.87706, 0.97626]),
-            6: be.array([0.18375, 0.41158, 0.61700, 0.78696, 0.91138, 0.98300]),
-        }
-        if num_rings not in radius_dict:
+        if num_rings not in self._RADII:
             raise ValueError("Gaussian quadrature must have between 1 and 6 rings.")
-        return radius_dict[num_rings]
+        return be.array(self._RADII[num_rings])
 
     def get_weights(self, num_rings):
         """Get weights for Gaussian quadrature distribution.
@@ -320,18 +331,10 @@ class GaussianQuadrature(BaseDistribution):
             be.ndarray: Array of weights.
 
         """
-        weights_dict = {
-            1: be.array([0.5]),
-            2: be.array([0.25, 0.25]),
-            3: be.array([0.13889, 0.22222, 0.13889]),
-            4: be.array([0.08696, 0.16304, 0.16304, 0.08696]),
-            5: be.array([0.059231, 0.11966, 0.14222, 0.11966, 0.059231]),
-            6: be.array([0.04283, 0.09019, 0.11698, 0.11698, 0.09019, 0.04283]),
-        }
-        if num_rings not in weights_dict:
+        if num_rings not in self._WEIGHTS:
             raise ValueError("Gaussian quadrature must have between 1 and 6 rings.")
 
-        weights = weights_dict[num_rings]
+        weights = be.array(self._WEIGHTS[num_rings])
         weights = weights * 6.0 if self.is_symmetric else weights * 2.0
 
         return weights
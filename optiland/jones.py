@@ -82,18 +82,62 @@ class JonesFresnel(BaseJones):
             be.ndarray: The calculated Jones matrix.
 
         """
-        # define local variables
-        n1 = self.material_pre.n(rays.w)
-        n2 = self.material_post.n(rays.w)
+        n = self.index_ratio(self.material_pre, self.material_post, rays.w)
+        return self.fresnel_matrix(n, aoi, reflect, be.size(rays.x))
 
+    @staticmethod
+    def index_ratio(material_pre, material_post, wavelength):
+        """Calculate the ratio of the post- to pre-surface refractive index.
+
+        Args:
+            material_pre (Material): Material object representing the
+                material before the surface.
+            material_post (Material): Material object representing the
+                material after the surface.
+            wavelength (be.ndarray): The wavelength of each ray in microns.
+
+        Returns:
+            be.ndarray: The index ratio, for each ray or, if all rays share
+                one wavelength, as a single element array.
+
+        Note:
+            With the NumPy backend, when all rays share one wavelength, the
+            refractive indices are evaluated once rather than once per ray.
+
+        """
+        if (
+            be.get_backend() == "numpy"
+            and wavelength.size > 1
+            and wavelength.min() == wavelength.max()
+        ):
+            wavelength = wavelength[:1]
+
+        n1 = material_pre.n(wavelength)
+        n2 = material_post.n(wavelength)
+        return n2 / n1
+
+    @staticmethod
+    def fresnel_matrix(n, aoi, reflect, num_rays):
+        """Calculate Fresnel Jones matrices from the index ratio.
+
+        Args:
+            n (float or be.ndarray): Ratio of the post- to pre-surface
+                refractive index.
+            aoi (be.ndarray): Array representing the angle of incidence.
+            reflect (bool): Indicates whether the rays are reflected or not.
+            num_rays (int): The number of rays.
+
+        Returns:
+            be.ndarray: The calculated Jones matrix.
+
+        """
         # precomputations for speed
         cos_theta_i = be.cos(aoi)
-        n = n2 / n1
         radicand = be.to_complex(n**2 - be.sin(aoi) ** 2)
         root = be.sqrt(radicand)
 
         # compute fresnel coefficients & compute jones matrices
-        jones_matrix = be.to_complex(be.zeros((be.size(rays.x), 3, 3)))
+        jones_matrix = be.to_complex(be.zeros((num_rays, 3, 3)))
         if reflect:
             s = (cos_theta_i - root) / (cos_theta_i + root)
             p = (n**2 * cos_theta_i - root) / (n**2 * cos_theta_i + root)
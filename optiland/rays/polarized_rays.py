@@ -115,7 +115,7 @@ class PolarizedRays(RealRays):
 
         """
         # merge k-vector components into matrix for speed
-        k0 = be.stack([self.L0, self.M0, self.N0]).T
+        k0 = self.dir_soa.T
         k1 = be.stack([self.L, self.M, self.N]).T
 
         # find s-component
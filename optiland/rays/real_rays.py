@@ -24,6 +24,8 @@ class RealRays(BaseRays):
         i (ndarray): The intensity of the rays.
         w (ndarray): The wavelength of the rays.
         opd (ndarray): The optical path length of the rays.
+        dir_soa (ndarray): The pre-surface direction cosines (L0, M0, N0)
+            stacked into a single (3, N) array.
 
     Methods:
         rotate_x(rx: float): Rotate the rays about the x-axis.
@@ -49,9 +51,30 @@ class RealRays(BaseRays):
         self.L0 = None
         self.M0 = None
         self.N0 = None
+        self._dir_soa = None
+        self._dir_soa_rows = None
 
         self.is_normalized = True
 
+    @property
+    def dir_soa(self):
+        """be.ndarray: The pre-surface direction cosines as a (3, N) array.
+
+        The array is built once per surface interaction and shared with L0, M0
+        and N0, which are views of its rows. If any of these attributes is
+        reassigned, the array is rebuilt on the next access.
+        """
+        rows = self._dir_soa_rows
+        if (
+            rows is None
+            or rows[0] is not self.L0
+            or rows[1] is not self.M0
+            or rows[2] is not self.N0
+        ):
+            self._dir_soa = be.stack([self.L0, self.M0, self.N0])
+            self._dir_soa_rows = (self.L0, self.M0, self.N0)
+        return self._dir_soa
+
     def rotate_x(self, rx: float):
         """Rotate the rays about the x-axis."""
         rx = be.array(rx)
@@ -125,9 +148,7 @@ class RealRays(BaseRays):
             RealRays: The refracted rays.
 
         """
-        self.L0 = be.copy(self.L)
-        self.M0 = be.copy(self.M)
-        self.N0 = be.copy(self.N)
+        self._store_incident_directions()
 
         u = n1 / n2
         nx, ny, nz, dot = self._align_surface_normal(nx, ny, nz)
@@ -153,9 +174,7 @@ class RealRays(BaseRays):
             RealRays: The reflected rays.
 
         """
-        self.L0 = be.copy(self.L)
-        self.M0 = be.copy(self.M)
-        self.N0 = be.copy(self.N)
+        self._store_incident_directions()
 
         nx, ny, nz, dot = self._align_surface_normal(nx, ny, nz)
 
@@ -163,6 +182,17 @@ class RealRays(BaseRays):
         self.M = self.M - 2 * dot * ny
         self.N = self.N - 2 * dot * nz
 
+    def _store_incident_directions(self):
+        """Store the current direction cosines as the pre-surface directions.
+
+        The directions are copied into a single (3, N) array, and L0, M0 and
+        N0 are set to views of its rows.
+        """
+        k0 = be.stack([self.L, self.M, self.N])
+        self.L0, self.M0, self.N0 = k0[0], k0[1], k0[2]
+        self._dir_soa = k0
+        self._dir_soa_rows = (self.L0, self.M0, self.N0)
+
     def update(self, jones_matrix: be.ndarray = None):
         """Update ray properties (primarily used for polarization)."""
 
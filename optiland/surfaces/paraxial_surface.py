@@ -95,13 +95,10 @@ class ParaxialSurface(Surface):
 
         # if there is a coating, modify ray properties
         if self.coating:
-            rays = self.coating.interact(
-                rays,
-                reflect=self.is_reflective,
-                nx=0,
-                ny=0,
-                nz=1,
-            )
+            if self.is_reflective:
+                rays = self.coating.reflect(rays, 0, 0, 1)
+            else:
+                rays = self.coating.transmit(rays, 0, 0, 1)
         else:
             # update polarization matrices, if PolarizedRays
             rays.update()
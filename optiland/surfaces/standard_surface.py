@@ -165,13 +165,10 @@ class Surface:
 
         # if there is a coating, modify ray properties
         if self.coating:
-            rays = self.coating.interact(
-                rays,
-                reflect=self.is_reflective,
-                nx=nx,
-                ny=ny,
-                nz=nz,
-            )
+            if self.is_reflective:
+                rays = self.coating.reflect(rays, nx, ny, nz)
+            else:
+                rays = self.coating.transmit(rays, nx, ny, nz)
         else:
             # update polarization matrices, if PolarizedRays
             rays.update()
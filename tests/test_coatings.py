@@ -1,9 +1,12 @@
 from copy import deepcopy
+from unittest.mock import patch
 
+import numpy as np
 import optiland.backend as be
 import pytest
 
 from optiland import coatings, materials, rays
+from optiland.jones import JonesFresnel
 from .utils import assert_allclose
 
 
@@ -64,6 +67,12 @@ def rays_non_parallel():
     return r
 
 
+def test_fast_arccos():
+    x = np.linspace(0, 1, 1001)
+    approx = np.array([coatings.fast_arccos(v) for v in x])
+    assert np.allclose(approx, np.arccos(x), rtol=0, atol=1e-7)
+
+
 class TestSimpleCoating:
     def test_interact_reflect(self, set_test_backend, rays_parallel):
         coating = coatings.SimpleCoating(transmittance=0.8, reflectance=0.1)
@@ -109,6 +118,14 @@ class TestSimpleCoating:
         assert_allclose(rays_after.i, 0.3 * i_before)
         assert_allclose(rays_after.w, w_before)
 
+    def test_interact_uses_current_methods(self, set_test_backend, rays_parallel):
+        coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
+        with patch.object(
+            coatings.SimpleCoating, "transmit", return_value="patched"
+        ) as mock_transmit:
+            assert coating.interact(rays_parallel, reflect=False) == "patched"
+        mock_transmit.assert_called_once()
+
     def test_compute_aoi(self, set_test_backend, rays_parallel):
         coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
 
@@ -120,6 +137,24 @@ class TestSimpleCoating:
 
         assert be.all(aoi == 0)
 
+    def test_compute_aoi_non_parallel(self, set_test_backend, rays_non_parallel):
+        coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
+
+        nx = be.zeros_like(rays_non_parallel.x)
+        ny = be.zeros_like(rays_non_parallel.y)
+        nz = -be.ones_like(rays_non_parallel.z)
+
+        aoi = coating._compute_aoi(rays_non_parallel, nx, ny, nz)
+
+        assert_allclose(aoi, be.arccos(rays_non_parallel.N0))
+
+    def test_compute_aoi_scalar_normals(self, set_test_backend, rays_non_parallel):
+        coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
+
+        aoi = coating._compute_aoi(rays_non_parallel, 0, 0, 1)
+
+        assert_allclose(aoi, be.arccos(rays_non_parallel.N0))
+
     def test_to_dict(self, set_test_backend):
         coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
         assert coating.to_dict() == {
@@ -128,6 +163,48 @@ class TestSimpleCoating:
             "reflectance": 0.5,
         }
 
+    def test_scale_intensity(self, set_test_backend):
+        intensity = be.ones(5)
+        result = coatings.SimpleCoating.scale_intensity(intensity, 0.25)
+        assert_allclose(result, 0.25 * be.ones(5))
+
+    @pytest.mark.parametrize("transmittance", [0.5, 0.0])
+    def test_input_intensity_unchanged(self, set_test_backend, transmittance):
+        intensity = be.ones(3)
+        r = rays.RealRays(
+            be.zeros(3),
+            be.zeros(3),
+            be.zeros(3),
+            be.zeros(3),
+            be.zeros(3),
+            be.ones(3),
+            intensity,
+            be.ones(3),
+        )
+        coating = coatings.SimpleCoating(transmittance=transmittance)
+        rays_after = coating.transmit(r)
+        assert_allclose(rays_after.i, transmittance * be.ones(3))
+        assert_allclose(intensity, be.ones(3))
+
+    def test_uncoated_shortcuts(self, set_test_backend, rays_parallel):
+        coating = coatings.SimpleCoating(transmittance=1.0, reflectance=0.0)
+        i_before = be.copy(rays_parallel.i)
+
+        rays_after = coating.transmit(rays_parallel)
+        assert_allclose(rays_after.i, i_before)
+
+        rays_after = coating.reflect(rays_parallel)
+        assert_allclose(rays_after.i, be.zeros_like(i_before))
+
+    def test_slots(self, set_test_backend):
+        coating = coatings.SimpleCoating(transmittance=0.3, reflectance=0.5)
+        assert not hasattr(coating, "__dict__")
+        with pytest.raises(AttributeError):
+            coating.color = "blue"
+
+        coating_copy = deepcopy(coating)
+        assert coating_copy.to_dict() == coating.to_dict()
+
 
 class TestFresnelCoating:
     def test_reflect(self, set_test_backend, rays_parallel_polarized):
@@ -164,6 +241,70 @@ class TestFresnelCoating:
         R = ((1.5 - 1.0) / (1.5 + 1.0)) ** 2
         assert be.allclose(rays_after.i * 1.5, (1 - R) * i_before)
 
+    @pytest.mark.parametrize(
+        "material_pre, material_post",
+        [
+            (
+                lambda: materials.IdealMaterial(n=1.0),
+                lambda: materials.IdealMaterial(n=1.5),
+            ),
+            (
+                lambda: materials.IdealMaterial(n=1.0),
+                lambda: materials.AbbeMaterial(n=1.5, abbe=60.0),
+            ),
+        ],
+        ids=["constant_index", "dispersive"],
+    )
+    @pytest.mark.parametrize("per_ray_wavelengths", [True, False])
+    @pytest.mark.parametrize("reflect", [True, False])
+    def test_calculate_jones_matches_jones(
+        self,
+        set_test_backend,
+        rays_non_parallel,
+        material_pre,
+        material_post,
+        per_ray_wavelengths,
+        reflect,
+    ):
+        num = be.size(rays_non_parallel.x)
+        if per_ray_wavelengths:
+            rays_non_parallel.w = be.linspace(0.45, 0.65, num)
+        else:
+            rays_non_parallel.w = be.full((num,), 0.55)
+        mat1 = material_pre()
+        mat2 = material_post()
+
+        # materials assigned after construction must be used
+        coating = coatings.FresnelCoating(
+            materials.IdealMaterial(n=1.0), materials.IdealMaterial(n=1.0)
+        )
+        coating.material_pre = mat1
+        coating.material_post = mat2
+
+        nx = be.zeros_like(rays_non_parallel.x)
+        ny = be.zeros_like(rays_non_parallel.y)
+        nz = be.ones_like(rays_non_parallel.z)
+
+        aoi = be.arccos(rays_non_parallel.N0)
+        expected = JonesFresnel(mat1, mat2).calculate_matrix(
+            rays_non_parallel, reflect=reflect, aoi=aoi
+        )
+        jones_matrix = coating._calculate_jones(
+            rays_non_parallel, nx, ny, nz, reflect=reflect
+        )
+
+        assert_allclose(be.real(jones_matrix), be.real(expected))
+        assert_allclose(be.imag(jones_matrix), be.imag(expected))
+
+    def test_constant_index_ratio(self, set_test_backend):
+        coating = coatings.FresnelCoating(
+            materials.IdealMaterial(n=1.0), materials.IdealMaterial(n=1.5)
+        )
+        assert_allclose(coating._constant_index_ratio(), 1.5)
+
+        coating.material_post = materials.AbbeMaterial(n=1.5, abbe=60.0)
+        assert coating._constant_index_ratio() is None
+
     def test_to_dict(self, set_test_backend):
         mat1 = materials.IdealMaterial(n=1.0)
         mat2 = materials.IdealMaterial(n=1.5)
@@ -181,3 +322,51 @@ class TestFresnelCoating:
         coating_dict = coating.to_dict()
         coating2 = coatings.FresnelCoating.from_dict(coating_dict)
         assert coating2.to_dict() == coating.to_dict()
+
+    def test_from_dict_independent_materials(self, set_test_backend):
+        data = {
+            "type": "FresnelCoating",
+            "material_pre": {"type": "IdealMaterial", "index": 1.0, "absorp": 0.0},
+            "material_post": {"type": "IdealMaterial", "index": 1.5, "absorp": 0.0},
+        }
+        coating1 = coatings.BaseCoating.from_dict(data)
+        coating2 = coatings.BaseCoating.from_dict(data)
+        assert isinstance(coating1, coatings.FresnelCoating)
+        assert coating1.material_post is not coating2.material_post
+
+        coating1.material_post.index = be.array([2.0])
+        coating3 = coatings.BaseCoating.from_dict(data)
+        assert_allclose(coating3.material_post.n(0.55), 1.5)
+
+    @pytest.mark.parametrize(
+        "set_test_backend", ["numpy"], indirect=True, ids=["backend=numpy"]
+    )
+    @pytest.mark.parametrize("reflect", [True, False])
+    def test_set_kernel_precision(self, set_test_backend, rays_non_parallel, reflect):
+        coating = coatings.FresnelCoating(
+            materials.IdealMaterial(n=1.0), materials.IdealMaterial(n=1.5)
+        )
+        nx = be.zeros_like(rays_non_parallel.x)
+        ny = be.zeros_like(rays_non_parallel.y)
+        nz = be.ones_like(rays_non_parallel.z)
+        expected_aoi = coating._compute_aoi(rays_non_parallel, nx, ny, nz)
+        expected = coating._calculate_jones(rays_non_parallel, nx, ny, nz, reflect)
+
+        coatings.set_kernel_precision("float32")
+        try:
+            assert coatings.get_kernel_precision() == "float32"
+            aoi = coating._compute_aoi(rays_non_parallel, nx, ny, nz)
+            jones_matrix = coating._calculate_jones(
+                rays_non_parallel, nx, ny, nz, reflect
+            )
+        finally:
+            coatings.set_kernel_precision("float64")
+
+        assert aoi.dtype == np.float32
+        assert jones_matrix.dtype == np.complex64
+        assert expected.dtype == np.complex128
+        assert np.allclose(aoi, expected_aoi, atol=1e-6)
+        assert np.allclose(jones_matrix, expected, atol=1e-6)
+
+        with pytest.raises(ValueError):
+            coatings.set_kernel_precision("float16")
@@ -1,5 +1,7 @@
+from functools import cache
 from unittest.mock import patch
 
+import numpy as np
 import optiland.backend as be
 import pytest
 
@@ -54,53 +56,94 @@ def test_random(set_test_backend, num_points):
     assert_allclose(d.y, y)
 
 
+@pytest.fixture(scope="session")
+def expected_hexapolar():
+    """Expected hexapolar points, memoized per number of rings.
+
+    The points are cached as NumPy arrays and converted with `be.array` on
+    each call, so they follow the active backend, precision and device.
+    """
+
+    @cache
+    def _expected(num_rings):
+        x = [np.zeros(1)]
+        y = [np.zeros(1)]
+        r = np.linspace(0, 1, num_rings + 1)
+
+        for i in range(num_rings):
+            num_theta = 6 * (i + 1)
+            theta = np.linspace(0, 2 * np.pi, num_theta + 1)[:-1]
+            x.append(r[i + 1] * np.cos(theta))
+            y.append(r[i + 1] * np.sin(theta))
+
+        return np.concatenate(x), np.concatenate(y)
+
+    def expected(num_rings):
+        x, y = _expected(num_rings)
+        return be.array(x), be.array(y)
+
+    return expected
+
+
+@pytest.fixture(scope="session")
+def expected_cross():
+    """Expected cross points, memoized per number of points.
+
+    The points are cached as NumPy arrays and converted with `be.array` on
+    each call, so they follow the active backend, precision and device.
+    """
+
+    @cache
+    def _expected(num_points):
+        # Expected points construction based on the new logic in CrossDistribution
+        y_line_x_expected = np.zeros(num_points)
+        y_line_y_expected = np.linspace(-1, 1, num_points)
+
+        x_line_x_expected_full = np.linspace(-1, 1, num_points)
+        x_line_y_expected_full = np.zeros(num_points)
+
+        if num_points % 2 == 1:  # Odd number of points
+            # Remove the middle element from the x-axis line as it's the
+            # duplicated origin
+            mask = np.arange(num_points) != num_points // 2
+            x_line_x_to_concat = x_line_x_expected_full[mask]
+            x_line_y_to_concat = x_line_y_expected_full[mask]
+        else:
+            # Even number of points (origin is not in the middle of linspace
+            # for an odd-length array)
+            x_line_x_to_concat = x_line_x_expected_full
+            x_line_y_to_concat = x_line_y_expected_full
+
+        # Concatenate in the same order as in the implementation
+        expected_x = np.concatenate((y_line_x_expected, x_line_x_to_concat))
+        expected_y = np.concatenate((y_line_y_expected, x_line_y_to_concat))
+        return expected_x, expected_y
+
+    def expected(num_points):
+        expected_x, expected_y = _expected(num_points)
+        return be.array(expected_x), be.array(expected_y)
+
+    return expected
+
+
 @pytest.mark.parametrize("num_rings", [3, 7, 15, 220])
-def test_hexapolar(set_test_backend, num_rings):
+def test_hexapolar(set_test_backend, expected_hexapolar, num_rings):
     d = distribution.create_distribution("hexapolar")
     d.generate_points(num_rings=num_rings)
 
-    x = be.zeros(1)
-    y = be.zeros(1)
-    r = be.linspace(0, 1, num_rings + 1)
-
-    for i in range(num_rings):
-        num_theta = 6 * (i + 1)
-        theta = be.linspace(0, 2 * be.pi, num_theta + 1)[:-1]
-        x = be.concatenate([x, r[i + 1] * be.cos(theta)])
-        y = be.concatenate([y, r[i + 1] * be.sin(theta)])
+    x, y = expected_hexapolar(num_rings)
+    assert be.size(x) == 1 + 3 * num_rings * (num_rings + 1)
 
     assert_allclose(d.x, x)
     assert_allclose(d.y, y)
 
 
 @pytest.mark.parametrize("num_points", [15, 56, 161, 621])
-def test_cross(set_test_backend, num_points):
+def test_cross(set_test_backend, expected_cross, num_points):
     d = distribution.create_distribution("cross")
     d.generate_points(num_points=num_points)
 
-    # Expected points construction based on the new logic in CrossDistribution
-    y_line_x_expected = be.zeros(num_points)
-    y_line_y_expected = be.linspace(-1, 1, num_points)
-
-    x_line_x_expected_full = be.linspace(-1, 1, num_points)
-    x_line_y_expected_full = be.zeros(num_points)
-
-    if num_points % 2 == 1:  # Odd number of points
-        # Remove the middle element from the x-axis line as it's the duplicated origin
-        mid_idx = num_points // 2
-        x_line_x_to_concat = be.concatenate(
-            (x_line_x_expected_full[:mid_idx], x_line_x_expected_full[mid_idx + 1 :])
-        )
-        x_line_y_to_concat = be.concatenate(
-            (x_line_y_expected_full[:mid_idx], x_line_y_expected_full[mid_idx + 1 :])
-        )
-    else:  # Even number of points (origin is not in the middle of linspace for an odd-length array)
-        x_line_x_to_concat = x_line_x_expected_full
-        x_line_y_to_concat = x_line_y_expected_full
-
-    # Concatenate in the same order as in the implementation
-    expected_x = be.concatenate((y_line_x_expected, x_line_x_to_concat))
-    expected_y = be.concatenate((y_line_y_expected, x_line_y_to_concat))
+    expected_x, expected_y = expected_cross(num_points)
 
     assert_allclose(d.x, expected_x)
     assert_allclose(d.y, expected_y)
@@ -426,44 +469,21 @@ def test_gaussian_quad_distribution_errors(set_test_backend):
         d.get_weights(num_rings=0)
 
 
-def test_gaussian_quad_weights(set_test_backend):
-    scale = [6.0, 2.0]
-    for k, is_symmetric in enumerate([True, False]):
-        # 1 ring
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=1)
-        assert_allclose(weights / scale[k], be.array([0.5]))
-
-        # 2 rings
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=2)
-        assert_allclose(weights / scale[k], be.array([0.25, 0.25]))
-
-        # 3 rings
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=3)
-        assert_allclose(weights / scale[k], be.array([0.13889, 0.22222, 0.13889]))
-
-        # 4 rings
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=4)
-        assert_allclose(
-            weights / scale[k],
-            be.array([0.08696, 0.16304, 0.16304, 0.08696]),
-        )
-
-        # 5 rings
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=5)
-        assert_allclose(
-            weights / scale[k],
-            be.array([0.059231, 0.11966, 0.14222, 0.11966, 0.059231]),
-        )
-
-        # 6 rings
-        d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
-        weights = d.get_weights(num_rings=6)
-        assert_allclose(
-            weights / scale[k],
-            be.array([0.04283, 0.09019, 0.11698, 0.11698, 0.09019, 0.04283]),
-        )
+@pytest.mark.parametrize(
+    "num_rings, expected",
+    [
+        (1, [0.5]),
+        (2, [0.25, 0.25]),
+        (3, [0.13889, 0.22222, 0.13889]),
+        (4, [0.08696, 0.16304, 0.16304, 0.08696]),
+        (5, [0.059231, 0.11966, 0.14222, 0.11966, 0.059231]),
+        (6, [0.04283, 0.09019, 0.11698, 0.11698, 0.09019, 0.04283]),
+    ],
+)
+@pytest.mark.parametrize("is_symmetric, scale", [(True, 6.0), (False, 2.0)])
+def test_gaussian_quad_weights(
+    set_test_backend, num_rings, expected, is_symmetric, scale
+):
+    d = distribution.GaussianQuadrature(is_symmetric=is_symmetric)
+    weights = d.get_weights(num_rings=num_rings)
+    assert_allclose(weights / scale, be.array(expected))
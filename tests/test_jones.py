@@ -56,6 +56,39 @@ class TestJonesFresnel:
         assert_allclose(be.real(jones_matrix[0, 1, 1]), 0.7963844602228702)
         assert_allclose(be.real(jones_matrix[0, 2, 2]), 1.0)
 
+    @pytest.mark.parametrize(
+        "wavelength",
+        [[0.5, 0.5, 0.5, 0.6, 0.6, 0.6], [0.55, 0.55, 0.55, 0.55, 0.55, 0.55]],
+    )
+    def test_matches_single_rays(self, set_test_backend, wavelength):
+        num = 6
+        rays = RealRays(
+            be.zeros(num),
+            be.zeros(num),
+            be.zeros(num),
+            be.zeros(num),
+            be.zeros(num),
+            be.ones(num),
+            be.ones(num),
+            be.array(wavelength),
+        )
+
+        material_pre = materials.IdealMaterial(n=1.0)
+        material_post = materials.Material("N-BK7")
+        jones_fresnel = jones.JonesFresnel(material_pre, material_post)
+
+        aoi = be.array([0.2, 0.0, 0.2, 0.2, 0.1, 0.0])
+        jones_matrix = jones_fresnel.calculate_matrix(rays, reflect=True, aoi=aoi)
+        assert jones_matrix.shape == (num, 3, 3)
+
+        for k in range(num):
+            single = RealRays(0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 1.0, rays.w[k])
+            expected = jones_fresnel.calculate_matrix(
+                single, reflect=True, aoi=aoi[k : k + 1]
+            )
+            assert_allclose(be.real(jones_matrix[k]), be.real(expected[0]))
+            assert_allclose(be.imag(jones_matrix[k]), be.imag(expected[0]))
+
 
 def test_jones_polarizer_H(set_test_backend):
     rays = RealRays(
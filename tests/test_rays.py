@@ -405,6 +405,49 @@ def test_reflect(set_test_backend):
     assert_allclose(rays.N[0], 0.0, atol=1e-10)
 
 
+def test_dir_soa(set_test_backend):
+    rays = RealRays(1.0, 2.0, 3.0, 0.6, 0.0, 0.8, 1.0, 1.0)
+    rays.reflect(0.0, 0.0, 1.0)
+
+    assert rays.dir_soa.shape == (3, 1)
+    assert_allclose(rays.dir_soa[0], rays.L0)
+    assert_allclose(rays.dir_soa[1], rays.M0)
+    assert_allclose(rays.dir_soa[2], rays.N0)
+    assert_allclose(rays.L0[0], 0.6)
+
+    # reassigning a component invalidates the cached array
+    rays.L0 = be.array([0.5])
+    assert_allclose(rays.dir_soa[0], be.array([0.5]))
+    assert_allclose(rays.dir_soa[2], be.array([0.8]))
+
+
+def test_dir_soa_consistent_across_interactions(set_test_backend):
+    L = be.array([0.0, 0.6])
+    M = be.array([0.0, 0.0])
+    N = be.array([1.0, 0.8])
+    rays = RealRays(
+        be.zeros(2), be.zeros(2), be.zeros(2), L, M, N, be.ones(2), be.ones(2)
+    )
+    nx = be.zeros(2)
+    ny = be.zeros(2)
+    nz = be.ones(2)
+
+    rays.refract(nx, ny, nz, 1.0, 1.5)
+    assert_allclose(rays.dir_soa, be.stack([L, M, N]))
+    assert_allclose(rays.L0, L)
+    L_refracted = be.copy(rays.L)
+    N_refracted = be.copy(rays.N)
+
+    # the stored directions are copies of the rays' directions
+    assert not be.allclose(rays.L, L)
+
+    rays.reflect(nx, ny, nz)
+    assert_allclose(rays.dir_soa[0], L_refracted)
+    assert_allclose(rays.dir_soa[2], N_refracted)
+    assert_allclose(rays.L0, L_refracted)
+    assert_allclose(rays.N0, N_refracted)
+
+
 def test_real_rays_str(set_test_backend):
     """Tests the __str__ method of the RealRays class."""
 